@@ -0,0 +1,380 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+import wake.development.transactions
+from wake.config import WakeConfig
+from wake.development.chain_interfaces import GethChainInterface
+from wake.development.json_rpc.abc import ProtocolAbc
+from wake.development.json_rpc.communicator import (
+    JsonRpcBatchRejectedError,
+    JsonRpcCommunicator,
+    JsonRpcError,
+)
+from wake.development.json_rpc.http import HttpProtocol
+from wake.development.json_rpc.serialization import json_loads
+from wake.development.transactions import wait_for_transactions
+
+
+class FakeProtocol(ProtocolAbc):
+    def __init__(self, respond):
+        self.respond = respond
+        self.sent: List[Any] = []
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def send_recv(self, data: bytes):
+        request = json.loads(data)
+        self.sent.append(request)
+        return self.respond(request)
+
+
+def _communicator(respond) -> JsonRpcCommunicator:
+    communicator = JsonRpcCommunicator(WakeConfig(), "http://localhost:8545")
+    communicator._protocol = FakeProtocol(respond)
+    return communicator
+
+
+def test_batch_request_out_of_order():
+    def respond(requests):
+        return [
+            {"jsonrpc": "2.0", "id": r["id"], "result": r["method"]}
+            for r in reversed(requests)
+        ]
+
+    communicator = _communicator(respond)
+    assert communicator.send_batch_request([]) == []
+    assert communicator.send_batch_request(
+        [("eth_chainId", None), ("eth_getBalance", ["0x00", "latest"])]
+    ) == ["eth_chainId", "eth_getBalance"]
+
+    sent = communicator._protocol.sent  # pyright: ignore reportGeneralTypeIssues
+    assert len(sent) == 1
+    assert [r["params"] for r in sent[0]] == [[], ["0x00", "latest"]]
+    assert len({r["id"] for r in sent[0]}) == 2
+
+
+def test_batch_request_split_by_max_batch_size():
+    def respond(requests):
+        return [
+            {"jsonrpc": "2.0", "id": r["id"], "result": r["params"][0]}
+            for r in reversed(requests)
+        ]
+
+    communicator = _communicator(respond)
+    assert communicator.send_batch_request(
+        [("eth_getBalance", [i]) for i in range(25)]
+    ) == list(range(25))
+
+    sent = communicator._protocol.sent  # pyright: ignore reportGeneralTypeIssues
+    assert [len(batch) for batch in sent] == [10, 10, 5]
+
+
+def test_batch_request_item_error():
+    def respond(requests):
+        return [
+            {"jsonrpc": "2.0", "id": requests[0]["id"], "result": "0x1"},
+            {
+                "jsonrpc": "2.0",
+                "id": requests[1]["id"],
+                "error": {"code": -32000, "message": "execution reverted"},
+            },
+        ]
+
+    communicator = _communicator(respond)
+    with pytest.raises(JsonRpcError) as e:
+        communicator.send_batch_request([("eth_chainId", None), ("eth_call", [{}])])
+    assert e.value.data == {"code": -32000, "message": "execution reverted"}
+
+
+def test_batch_request_missing_response():
+    def respond(requests):
+        return [
+            {"jsonrpc": "2.0", "id": requests[0]["id"], "result": "0x1"},
+            {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "Invalid request"},
+            },
+        ]
+
+    communicator = _communicator(respond)
+    with pytest.raises(JsonRpcError) as e:
+        communicator.send_batch_request([("eth_chainId", None), ("eth_call", [{}])])
+    assert "eth_call" in e.value.data["message"]
+    assert e.value.data["data"] == {"code": -32600, "message": "Invalid request"}
+
+    communicator = _communicator(lambda requests: [])
+    with pytest.raises(JsonRpcError) as e:
+        communicator.send_batch_request([("eth_chainId", None)])
+    assert "eth_chainId" in e.value.data["message"]
+
+
+def test_batch_request_rejected():
+    def respond(requests):
+        return {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "batch requests not supported"},
+        }
+
+    communicator = _communicator(respond)
+    with pytest.raises(JsonRpcBatchRejectedError) as e:
+        communicator.send_batch_request([("eth_chainId", None), ("eth_gasPrice", None)])
+    assert e.value.data == {"code": -32600, "message": "batch requests not supported"}
+
+
+def test_fees_fall_back_without_batch_support():
+    def respond(request):
+        if isinstance(request, list):
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "batch requests not supported"},
+            }
+        result = (
+            "0x10"
+            if request["method"] == "eth_maxPriorityFeePerGas"
+            else {"baseFeePerGas": "0x20"}
+        )
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    communicator = _communicator(respond)
+    chain_interface = GethChainInterface(WakeConfig(), communicator)
+    assert chain_interface.get_max_priority_fee_per_gas_and_base_fee() == (16, 32)
+    assert chain_interface.get_max_priority_fee_per_gas_and_base_fee() == (16, 32)
+
+    # the batch is not retried once rejected
+    sent = communicator._protocol.sent  # pyright: ignore reportGeneralTypeIssues
+    assert [isinstance(r, list) for r in sent] == [True] + [False] * 4
+
+
+def test_fees_batch_item_error_propagates():
+    def respond(requests):
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": requests[0]["id"],
+                "error": {"code": -32601, "message": "method not found"},
+            },
+            {"jsonrpc": "2.0", "id": requests[1]["id"], "result": {}},
+        ]
+
+    communicator = _communicator(respond)
+    chain_interface = GethChainInterface(WakeConfig(), communicator)
+    with pytest.raises(JsonRpcError) as e:
+        chain_interface.get_max_priority_fee_per_gas_and_base_fee()
+    assert e.value.data == {"code": -32601, "message": "method not found"}
+    assert chain_interface._batch_requests_supported
+
+
+def test_receipts_fall_back_without_batch_support():
+    def respond(request):
+        if isinstance(request, list):
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "batch requests not supported"},
+            }
+        tx_hash = request["params"][0]
+        result = {"transactionHash": tx_hash} if tx_hash != "0x2" else None
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    communicator = _communicator(respond)
+    chain_interface = GethChainInterface(WakeConfig(), communicator)
+    expected = [{"transactionHash": "0x1"}, None, {"transactionHash": "0x3"}]
+    assert chain_interface.get_transaction_receipts(["0x1", "0x2", "0x3"]) == expected
+    assert chain_interface.get_transaction_receipts(["0x1", "0x2", "0x3"]) == expected
+
+    # the batch is not retried once rejected
+    sent = communicator._protocol.sent  # pyright: ignore reportGeneralTypeIssues
+    assert [isinstance(r, list) for r in sent] == [True] + [False] * 6
+
+
+def test_json_loads_wide_integers():
+    assert json_loads(b'{"a": 123456789012345678901234567890}') == {
+        "a": 123456789012345678901234567890
+    }
+    assert json_loads(b"[1,\n -18446744073709551617]") == [1, -18446744073709551617]
+    assert json_loads(b'{"result":"0x123456789012345678901234567890"}') == {
+        "result": "0x123456789012345678901234567890"
+    }
+
+
+class FakeChainInterface:
+    def __init__(self, mined_after):
+        # tx hash -> number of polls before the receipt is available
+        self.mined_after = mined_after
+        self.polls: List[List[str]] = []
+
+    def get_transaction_receipts(self, tx_hashes):
+        self.polls.append(list(tx_hashes))
+        poll = len(self.polls)
+        return [
+            {"transactionHash": h} if poll >= self.mined_after[h] else None
+            for h in tx_hashes
+        ]
+
+
+class FakeChain:
+    def __init__(self, chain_interface):
+        self.chain_interface = chain_interface
+
+
+class FakeTransaction:
+    def __init__(self, chain, tx_hash, receipt=None):
+        self.chain = chain
+        self.tx_hash = tx_hash
+        self._tx_receipt = receipt
+
+
+def test_wait_for_transactions(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(wake.development.transactions.time, "sleep", sleeps.append)
+
+    chain_interface = FakeChainInterface({"0x1": 4, "0x2": 1, "0x3": 5})
+    chain = FakeChain(chain_interface)
+    already_mined = FakeTransaction(chain, "0x0", {"transactionHash": "0x0"})
+    txs = [FakeTransaction(chain, h) for h in ("0x1", "0x2", "0x3")]
+
+    yielded = [tx.tx_hash for tx in wait_for_transactions([already_mined] + txs, 0.01)]
+    assert yielded == ["0x0", "0x2", "0x1", "0x3"]
+    assert all(tx._tx_receipt == {"transactionHash": tx.tx_hash} for tx in txs)
+
+    # receipts of all pending txs are fetched together, mined ones are dropped
+    assert chain_interface.polls == [
+        ["0x1", "0x2", "0x3"],
+        ["0x1", "0x3"],
+        ["0x1", "0x3"],
+        ["0x1", "0x3"],
+        ["0x3"],
+    ]
+    # the interval resets after each mined tx and doubles while nothing is mined
+    assert sleeps == pytest.approx([0.01, 0.02, 0.04, 0.01])
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1  # pyright: ignore reportGeneralTypeIssues
+
+    def finish(self):
+        super().finish()
+        self.server.finished.set()  # pyright: ignore reportGeneralTypeIssues
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(  # pyright: ignore reportGeneralTypeIssues
+            (self.path, body)
+        )
+        if body == b'"drop"':
+            # close the connection after reading the request, without responding
+            self.close_connection = True
+            return
+
+        response = json.dumps({"jsonrpc": "2.0", "id": 1, "result": "ok"}).encode()
+        self.send_response(403 if body == b'"forbidden"' else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+        if body == b'"close-after"':
+            # keep-alive was not refused, the idle connection is dropped afterwards
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    server.connections = 0  # pyright: ignore reportGeneralTypeIssues
+    server.requests = []  # pyright: ignore reportGeneralTypeIssues
+    server.finished = threading.Event()  # pyright: ignore reportGeneralTypeIssues
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_keep_alive(http_server):
+    protocol = HttpProtocol(f"http://127.0.0.1:{http_server.server_port}/", 5)
+    with protocol:
+        for _ in range(3):
+            assert protocol.send_recv(b'"ok"')["result"] == "ok"
+    assert http_server.connections == 1
+    assert len(http_server.requests) == 3
+
+
+def test_http_no_resend_after_request_written(http_server):
+    protocol = HttpProtocol(f"http://127.0.0.1:{http_server.server_port}/", 5)
+    with protocol:
+        protocol.send_recv(b'"ok"')
+        with pytest.raises(URLError):
+            protocol.send_recv(b'"drop"')
+        assert protocol.send_recv(b'"ok"')["result"] == "ok"
+    assert [body for _, body in http_server.requests].count(b'"drop"') == 1
+
+
+def test_http_reconnect_on_dropped_idle_connection(http_server):
+    protocol = HttpProtocol(f"http://127.0.0.1:{http_server.server_port}/", 5)
+    with protocol:
+        protocol.send_recv(b'"close-after"')
+        assert http_server.finished.wait(5)
+        assert protocol.send_recv(b'"ok"')["result"] == "ok"
+    assert http_server.connections == 2
+    assert [body for _, body in http_server.requests] == [b'"close-after"', b'"ok"']
+
+
+def test_http_keep_alive_high_file_descriptor(http_server):
+    # socket file descriptors >= 1024 are out of range for select() on POSIX
+    resource = pytest.importorskip("resource")
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < 1100:
+        pytest.skip("not enough file descriptors available")
+
+    fds = []
+    try:
+        while len(fds) == 0 or fds[-1] < 1024:
+            fds.append(os.dup(0))
+
+        protocol = HttpProtocol(f"http://127.0.0.1:{http_server.server_port}/", 5)
+        with protocol:
+            for _ in range(3):
+                assert protocol.send_recv(b'"ok"')["result"] == "ok"
+        assert http_server.connections == 1
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def test_http_error_status(http_server):
+    protocol = HttpProtocol(f"http://127.0.0.1:{http_server.server_port}/", 5)
+    with protocol:
+        with pytest.raises(HTTPError) as e:
+            protocol.send_recv(b'"forbidden"')
+    assert e.value.code == 403
+
+
+def test_http_proxy_from_environment(http_server, monkeypatch):
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{http_server.server_port}")
+    protocol = HttpProtocol("http://node.invalid:8545/rpc", 5)
+    with protocol:
+        assert protocol.send_recv(b'"ok"')["result"] == "ok"
+    assert http_server.requests == [("http://node.invalid:8545/rpc", b'"ok"')]
@@ -375,6 +375,10 @@ class GeneralConfig(WakeConfigModel):
     """
     Timeout applied to JSON-RPC requests.
     """
+    json_rpc_max_batch_size: int = Field(default=10, ge=1)
+    """
+    Maximum number of requests sent in a single JSON-RPC batch, larger batches are split.
+    """
     link_format: str = "vscode://file/{path}:{line}:{col}"
     """
     Format of links used in detectors and printers.
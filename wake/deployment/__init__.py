@@ -16,6 +16,7 @@ from wake.development.transactions import (
     may_revert,
     must_revert,
     on_revert,
+    wait_for_transactions,
 )
 from wake.development.utils import (
     get_create2_address_from_code,
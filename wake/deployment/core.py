@@ -1,10 +1,9 @@
 import os
 import time
 from contextlib import contextmanager, nullcontext
-from typing import Any, Dict, Iterable, Optional, Union, cast
+from typing import Dict, Iterable, Optional, Union
 from urllib.error import HTTPError
 
-import eth_utils
 from Crypto.Hash import keccak
 from rich.console import Group
 from rich.pretty import pprint
@@ -16,14 +15,15 @@ import wake.development.core
 from wake.cli.console import console
 from wake.development.chain_interfaces import AnvilChainInterface, TxParams
 from wake.development.core import (
+    TX_TYPE_FORBIDDEN_PARAMS,
     Abi,
-    Address,
+    ChainSnapshot,
     RequestType,
     RevertToSnapshotFailedError,
     TransactionConfirmationFailedError,
     Wei,
     check_connected,
-    fix_library_abi,
+    get_abi_input_types,
 )
 from wake.development.globals import chain_interfaces_manager, get_config
 from wake.development.json_rpc.communicator import JsonRpcError
@@ -83,14 +83,19 @@ class Chain(wake.development.core.Chain):
     def snapshot(self) -> str:
         snapshot_id = self._chain_interface.snapshot()
 
-        self._snapshots[snapshot_id] = {
-            "nonces": self._nonces.copy(),
-            "accounts": self._accounts.copy(),
-            "default_call_account": self._default_call_account,
-            "default_tx_account": self._default_tx_account,
-            "txs": dict(self._txs._transactions),
-            "blocks": dict(self._blocks._blocks),
-        }
+        self._snapshots[snapshot_id] = ChainSnapshot(
+            nonces=self._nonces.copy(),
+            accounts=self._accounts.copy(),
+            default_call_account=self._default_call_account,
+            default_tx_account=self._default_tx_account,
+            txs=self._txs._transactions,
+            blocks=self._blocks._blocks,
+            block_gas_limit=None,
+        )
+        # copy-on-write: the saved maps are never written to again,
+        # new entries go to a fresh layer that is dropped on revert
+        self._txs._transactions = self._txs._transactions.new_child()
+        self._blocks._blocks = self._blocks._blocks.new_child()
         return snapshot_id
 
     @check_connected
@@ -100,12 +105,13 @@ class Chain(wake.development.core.Chain):
             raise RevertToSnapshotFailedError()
 
         snapshot = self._snapshots[snapshot_id]
-        self._nonces = snapshot["nonces"]
-        self._accounts = snapshot["accounts"]
-        self._default_call_account = snapshot["default_call_account"]
-        self._default_tx_account = snapshot["default_tx_account"]
-        self._txs._transactions = snapshot["txs"]
-        self._blocks._blocks = snapshot["blocks"]
+        self._nonces = snapshot.nonces
+        self._accounts = snapshot.accounts
+        self._default_call_account = snapshot.default_call_account
+        self._default_tx_account = snapshot.default_tx_account
+        self._update_default_senders()
+        self._txs._transactions = snapshot.txs
+        self._blocks._blocks = snapshot.blocks
         del self._snapshots[snapshot_id]
 
     @property
@@ -152,72 +158,45 @@ class Chain(wake.development.core.Chain):
         abi: Optional[Dict],
     ) -> TxParams:
         tx_type = params.get("type", self._default_tx_type)
-        if tx_type not in {0, 1, 2}:
-            raise ValueError("Invalid transaction type")
-
-        if tx_type == 0 and (
-            "accessList" in params
-            or "maxFeePerGas" in params
-            or "maxPriorityFeePerGas" in params
-        ):
-            raise ValueError(
-                "Cannot specify accessList, maxFeePerGas, or maxPriorityFeePerGas for type 0 transaction"
-            )
-        elif tx_type == 1 and (
-            "maxFeePerGas" in params or "maxPriorityFeePerGas" in params
-        ):
-            raise ValueError(
-                "Cannot specify maxFeePerGas or maxPriorityFeePerGas for type 1 transaction"
-            )
-        elif tx_type == 2 and "gasPrice" in params:
-            raise ValueError("Cannot specify gasPrice for type 2 transaction")
-
-        if "from" in params:
-            sender = params["from"]
-        else:
-            if request_type == "call" and self.default_call_account is not None:
-                sender = str(self.default_call_account.address)
-            elif request_type == "tx" and self.default_tx_account is not None:
-                sender = str(self.default_tx_account.address)
-            elif (
-                request_type == "estimate" and self.default_estimate_account is not None
-            ):
-                sender = str(self.default_estimate_account.address)
-            elif (
-                request_type == "access_list"
-                and self.default_access_list_account is not None
-            ):
-                sender = str(self.default_access_list_account.address)
-            else:
+        try:
+            forbidden_params, error_message = TX_TYPE_FORBIDDEN_PARAMS[tx_type]
+        except KeyError:
+            raise ValueError("Invalid transaction type") from None
+        if not forbidden_params.isdisjoint(params):
+            raise ValueError(error_message)
+
+        # None is never a valid value for these keys, so it marks a missing key
+        sender = params.get("from")
+        access_list = params.get("accessList")
+        gas = params.get("gas")
+
+        if sender is None:
+            try:
+                sender = self._default_senders[request_type]
+            except KeyError:
                 raise ValueError(
                     "No from_ account specified and no default account set"
-                )
+                ) from None
 
-        if "data" not in params:
-            params["data"] = b""
-
-        if abi is None:
-            params["data"] += Abi.encode([], [])
-        else:
+        data = params.get("data", b"")
+        # without an ABI there are no arguments to encode (Abi.encode([], []) == b"")
+        if abi is not None:
             arguments = [self._convert_to_web3_type(arg) for arg in arguments]
-            types = [
-                eth_utils.abi.collapse_if_tuple(cast(Dict[str, Any], arg))
-                for arg in fix_library_abi(abi["inputs"])
-            ]
-            params["data"] += Abi.encode(types, arguments)
+            data += Abi.encode(get_abi_input_types(abi["inputs"]), arguments)
 
-        n = self._nonces[Address(sender)]
+        n = self._nonces[sender.lower()]
         tx: TxParams = {
             "nonce": n,
             "from": sender,
-            "value": params["value"] if "value" in params else 0,
-            "data": params["data"],
+            "value": params.get("value", 0),
+            "data": data,
         }
         if tx_type != 0:
             tx["type"] = tx_type
 
-        if "to" in params:
-            tx["to"] = params["to"]
+        to = params.get("to")
+        if to is not None:
+            tx["to"] = to
 
         if tx_type == 0:
             tx["gasPrice"] = (
@@ -250,7 +229,7 @@ class Chain(wake.development.core.Chain):
                         * 2
                     )
 
-        if "gas" not in params or params["gas"] == "auto":
+        if gas is None or gas == "auto":
             # use "auto when unset
             try:
                 tx_copy = tx.copy()
@@ -260,26 +239,26 @@ class Chain(wake.development.core.Chain):
                 tx["gas"] = int(self._chain_interface.estimate_gas(tx_copy) * 1.1)
             except JsonRpcError as e:
                 raise self._process_call_revert(e) from None
-        elif isinstance(params["gas"], int):
-            tx["gas"] = params["gas"]
+        elif isinstance(gas, int):
+            tx["gas"] = gas
         else:
-            raise ValueError(f"Invalid gas value: {params['gas']}")
+            raise ValueError(f"Invalid gas value: {gas}")
 
         if (
             tx_type in {1, 2}
-            and ("accessList" not in params or params["accessList"] == "auto")
+            and (access_list is None or access_list == "auto")
             and request_type != "access_list"
         ):
             try:
                 response = self._chain_interface.create_access_list(tx)
                 gas_used = int(int(response["gasUsed"], 16) * 1.1)
 
-                if params.get("accessList", None) == "auto" or (
-                    "accessList" not in params and gas_used <= tx["gas"]
+                if access_list == "auto" or (
+                    access_list is None and gas_used <= tx["gas"]
                 ):
                     tx["accessList"] = response["accessList"]
 
-                    if "gas" not in params or params["gas"] == "auto":
+                    if gas is None or gas == "auto":
                         tx["gas"] = gas_used
             except (JsonRpcError, HTTPError) as e:
                 try:
@@ -288,13 +267,13 @@ class Chain(wake.development.core.Chain):
                         raise self._process_call_revert(e) from None
                     else:
                         # HTTPError -> eth_createAccessList not supported
-                        if "accessList" not in params:
+                        if access_list is None:
                             tx["accessList"] = []
                         else:
                             raise
                 except JsonRpcError:
                     # eth_createAccessList probably not supported
-                    if "accessList" not in params:
+                    if access_list is None:
                         tx["accessList"] = []
                     else:
                         raise
@@ -313,12 +292,10 @@ class Chain(wake.development.core.Chain):
             t = Table("", "Set in transaction", "Current recommended")
 
             if isinstance(tx, Eip1559Transaction):
-                recommended_priority_fee = (
-                    self.chain_interface.get_max_priority_fee_per_gas()
-                )
-                base_fee = int(
-                    self.chain_interface.get_block("pending")["baseFeePerGas"], 16
-                )
+                (
+                    recommended_priority_fee,
+                    base_fee,
+                ) = self.chain_interface.get_max_priority_fee_per_gas_and_base_fee()
 
                 t.add_row(
                     "Max fee per gas",
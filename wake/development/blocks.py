@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import ChainMap
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from typing_extensions import Literal
@@ -11,11 +12,12 @@ if TYPE_CHECKING:
 
 class ChainBlocks:
     _chain: Chain
-    _blocks: Dict[int, Block]
+    # new layer is pushed on every snapshot, see Chain.snapshot
+    _blocks: ChainMap[int, Block]
 
     def __init__(self, chain: Chain):
         self._chain = chain
-        self._blocks = {}
+        self._blocks = ChainMap()
 
     def __getitem__(
         self,
@@ -28,8 +30,10 @@ class ChainBlocks:
             Literal["finalized"],
         ],
     ) -> Block:
+        latest_block_number = None
         if isinstance(key, int) and key < 0:
-            key = self._chain.chain_interface.get_block_number() + key + 1
+            latest_block_number = self._chain.chain_interface.get_block_number()
+            key = latest_block_number + key + 1
         if key not in self._blocks:
             data = self._chain.chain_interface.get_block(key)
             if data is None:
@@ -42,7 +46,10 @@ class ChainBlocks:
                 if block_number in self._blocks:
                     return self._blocks[block_number]
 
-                if block.number <= self._chain.chain_interface.get_block_number():
+                # a block at or below an already known head is mined, no need to ask again
+                if latest_block_number is None:
+                    latest_block_number = self._chain.chain_interface.get_block_number()
+                if block.number <= latest_block_number:
                     self._blocks[block.number] = block
         else:
             block = self._blocks[key]
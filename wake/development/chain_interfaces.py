@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import binascii
 import subprocess
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
-from urllib.error import URLError
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.error import HTTPError, URLError
 
 from typing_extensions import Literal, TypedDict
 
@@ -12,7 +13,13 @@ from wake.cli.console import console
 from wake.config import WakeConfig
 from wake.utils.networking import get_free_port
 
-from .json_rpc.communicator import JsonRpcCommunicator
+from .json_rpc.communicator import JsonRpcBatchRejectedError, JsonRpcCommunicator
+
+
+def _hex_to_bytes(data: str) -> bytes:
+    # unhexlify does not skip whitespace like bytes.fromhex, about 2x faster for short data
+    return binascii.unhexlify(data[2:])
+
 
 TxParams = TypedDict(
     "TxParams",
@@ -38,6 +45,11 @@ class ChainInterfaceAbc(ABC):
     _config: WakeConfig
     _communicator: JsonRpcCommunicator
     _process: Optional[subprocess.Popen]
+    # do not change for the lifetime of the connection (chain id only with reset)
+    _client_version: Optional[str]
+    _chain_id: Optional[int]
+    # cleared when the node (or a provider in front of it) rejects a batch request
+    _batch_requests_supported: bool
 
     def __init__(
         self,
@@ -48,6 +60,9 @@ class ChainInterfaceAbc(ABC):
         self._config = config
         self._communicator = communicator
         self._process = process
+        self._client_version = None
+        self._chain_id = None
+        self._batch_requests_supported = True
 
     @staticmethod
     def _encode_tx_params(transaction: TxParams) -> Dict:
@@ -82,10 +97,11 @@ class ChainInterfaceAbc(ABC):
 
     @staticmethod
     def _encode_block_identifier(block_identifier: Union[int, str]) -> str:
-        if isinstance(block_identifier, int):
-            return hex(block_identifier)
-        elif isinstance(block_identifier, str):
+        # tags ("latest", "pending") are the defaults of most methods, check them first
+        if isinstance(block_identifier, str):
             return block_identifier
+        elif isinstance(block_identifier, int):
+            return hex(block_identifier)
         else:
             raise TypeError("block identifier must be either int or str")
 
@@ -221,28 +237,27 @@ class ChainInterfaceAbc(ABC):
         communicator = JsonRpcCommunicator(config, uri)
         communicator.__enter__()
         try:
-            client_version: str = communicator.send_request(
-                "web3_clientVersion"
-            ).lower()
+            raw_client_version: str = communicator.send_request("web3_clientVersion")
+            client_version = raw_client_version.lower()
             chain_id = int(communicator.send_request("eth_chainId"), 16)
             if "anvil" in client_version:
-                return AnvilChainInterface(config, communicator)
+                chain_interface = AnvilChainInterface(config, communicator)
             elif "hardhat" in client_version:
-                return HardhatChainInterface(config, communicator)
+                chain_interface = HardhatChainInterface(config, communicator)
             elif "ethereumjs" in client_version:
-                return GanacheChainInterface(config, communicator)
+                chain_interface = GanacheChainInterface(config, communicator)
             elif client_version.startswith(("geth", "bor")):
-                return GethChainInterface(config, communicator)
+                chain_interface = GethChainInterface(config, communicator)
             elif client_version.startswith("erigon"):
-                return ErigonChainInterface(config, communicator)
+                chain_interface = ErigonChainInterface(config, communicator)
             elif "nitro" in client_version:
-                return NitroChainInterface(config, communicator)
+                chain_interface = NitroChainInterface(config, communicator)
             elif chain_id in {43113, 43114}:
                 # Avax client reports just a version number without the name of the client
                 # => hard to distinguish from other clients
-                return AvalancheChainInterface(config, communicator)
+                chain_interface = AvalancheChainInterface(config, communicator)
             elif chain_id in {1101, 1442}:
-                return HermezChainInterface(config, communicator)
+                chain_interface = HermezChainInterface(config, communicator)
             else:
                 raise NotImplementedError(
                     f"Client version {client_version} not supported"
@@ -251,6 +266,10 @@ class ChainInterfaceAbc(ABC):
             communicator.__exit__(None, None, None)
             raise
 
+        chain_interface._client_version = raw_client_version
+        chain_interface._chain_id = chain_id
+        return chain_interface
+
     def close(self) -> None:
         self._communicator.__exit__(None, None, None)
         if self._process is not None:
@@ -261,7 +280,9 @@ class ChainInterfaceAbc(ABC):
                 self._process.kill()
 
     def get_client_version(self) -> str:
-        return self._communicator.send_request("web3_clientVersion")
+        if self._client_version is None:
+            self._client_version = self._communicator.send_request("web3_clientVersion")
+        return self._client_version
 
     def get_balance(
         self, address: str, block_identifier: Union[int, str] = "latest"
@@ -277,11 +298,11 @@ class ChainInterfaceAbc(ABC):
     def get_code(
         self, address: str, block_identifier: Union[int, str] = "latest"
     ) -> bytes:
-        return bytes.fromhex(
+        return _hex_to_bytes(
             self._communicator.send_request(
                 "eth_getCode",
                 [address, self._encode_block_identifier(block_identifier)],
-            )[2:]
+            )
         )
 
     def get_coinbase(self) -> str:
@@ -302,7 +323,9 @@ class ChainInterfaceAbc(ABC):
         return self._communicator.send_request("eth_getTransactionByHash", [tx_hash])
 
     def get_chain_id(self) -> int:
-        return int(self._communicator.send_request("eth_chainId"), 16)
+        if self._chain_id is None:
+            self._chain_id = int(self._communicator.send_request("eth_chainId"), 16)
+        return self._chain_id
 
     def get_gas_price(self) -> int:
         return int(self._communicator.send_request("eth_gasPrice"), 16)
@@ -321,17 +344,33 @@ class ChainInterfaceAbc(ABC):
     def get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         return self._communicator.send_request("eth_getTransactionReceipt", [tx_hash])
 
+    def get_transaction_receipts(
+        self, tx_hashes: Sequence[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        if self._batch_requests_supported:
+            try:
+                return self._communicator.send_batch_request(
+                    [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+                )
+            except (JsonRpcBatchRejectedError, HTTPError):
+                self._batch_requests_supported = False
+
+        return [
+            self._communicator.send_request("eth_getTransactionReceipt", [tx_hash])
+            for tx_hash in tx_hashes
+        ]
+
     def call(
         self, params: TxParams, block_identifier: Union[int, str] = "latest"
     ) -> bytes:
-        return bytes.fromhex(
+        return _hex_to_bytes(
             self._communicator.send_request(
                 "eth_call",
                 [
                     self._encode_tx_params(params),
                     self._encode_block_identifier(block_identifier),
                 ],
-            )[2:]
+            )
         )
 
     def estimate_gas(
@@ -400,18 +439,38 @@ class ChainInterfaceAbc(ABC):
     def get_max_priority_fee_per_gas(self) -> int:
         return int(self._communicator.send_request("eth_maxPriorityFeePerGas"), 16)
 
+    def get_max_priority_fee_per_gas_and_base_fee(self) -> Tuple[int, int]:
+        # fetched together when recommending EIP-1559 fees, one round trip instead of two
+        if self._batch_requests_supported:
+            try:
+                (
+                    max_priority_fee_per_gas,
+                    pending_block,
+                ) = self._communicator.send_batch_request(
+                    [
+                        ("eth_maxPriorityFeePerGas", None),
+                        ("eth_getBlockByNumber", ["pending", False]),
+                    ]
+                )
+                return int(max_priority_fee_per_gas, 16), int(
+                    pending_block["baseFeePerGas"], 16
+                )
+            except (JsonRpcBatchRejectedError, HTTPError):
+                # errors of single requests in the batch are not a rejection and propagate
+                self._batch_requests_supported = False
+
+        return self.get_max_priority_fee_per_gas(), int(
+            self.get_block("pending")["baseFeePerGas"], 16
+        )
+
     def sign(self, address: str, message: bytes) -> bytes:
-        return bytes.fromhex(
-            self._communicator.send_request(
-                "eth_sign", [address, "0x" + message.hex()]
-            )[2:]
+        return _hex_to_bytes(
+            self._communicator.send_request("eth_sign", [address, "0x" + message.hex()])
         )
 
     def sign_typed(self, address: str, message: Dict) -> bytes:
-        return bytes.fromhex(
-            self._communicator.send_request("eth_signTypedData_v4", [address, message])[
-                2:
-            ]
+        return _hex_to_bytes(
+            self._communicator.send_request("eth_signTypedData_v4", [address, message])
         )
 
     def create_access_list(
@@ -431,7 +490,7 @@ class ChainInterfaceAbc(ABC):
     def get_storage_at(
         self, address: str, position: int, block_identifier: Union[int, str] = "latest"
     ) -> bytes:
-        return bytes.fromhex(
+        return _hex_to_bytes(
             self._communicator.send_request(
                 "eth_getStorageAt",
                 [
@@ -439,7 +498,7 @@ class ChainInterfaceAbc(ABC):
                     hex(position),
                     self._encode_block_identifier(block_identifier),
                 ],
-            )[2:]
+            )
         )
 
     def get_logs(
@@ -542,6 +601,8 @@ class HardhatChainInterface(ChainInterfaceAbc):
         self._communicator.send_request(
             "hardhat_reset", [options] if options is not None else None
         )
+        # may fork a different chain
+        self._chain_id = None
 
     def set_coinbase(self, address: str) -> None:
         self._communicator.send_request("hardhat_setCoinbase", [address])
@@ -613,6 +674,8 @@ class AnvilChainInterface(ChainInterfaceAbc):
         self._communicator.send_request(
             "anvil_reset", [options] if options is not None else None
         )
+        # may fork a different chain
+        self._chain_id = None
 
     def set_coinbase(self, address: str) -> None:
         self._communicator.send_request("anvil_setCoinbase", [address])
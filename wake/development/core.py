@@ -20,8 +20,10 @@ from typing import (
     Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     Iterable,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -126,6 +128,23 @@ class TransactionConfirmationFailedError(Exception):
     pass
 
 
+# tx params that must not be set for a given tx type, with the error message raised otherwise
+TX_TYPE_FORBIDDEN_PARAMS: Dict[int, Tuple[FrozenSet[str], str]] = {
+    0: (
+        frozenset({"accessList", "maxFeePerGas", "maxPriorityFeePerGas"}),
+        "Cannot specify accessList, maxFeePerGas, or maxPriorityFeePerGas for type 0 transaction",
+    ),
+    1: (
+        frozenset({"maxFeePerGas", "maxPriorityFeePerGas"}),
+        "Cannot specify maxFeePerGas or maxPriorityFeePerGas for type 1 transaction",
+    ),
+    2: (
+        frozenset({"gasPrice"}),
+        "Cannot specify gasPrice for type 2 transaction",
+    ),
+}
+
+
 class RequestType(StrEnum):
     ACCESS_LIST = "access_list"
     CALL = "call"
@@ -155,6 +174,25 @@ def fix_library_abi(args: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return ret
 
 
+# keyed by id() of the ABI inputs list (ABIs are module-level constants in pytypes)
+# each entry holds a reference to the inputs list so that the id cannot be reused
+_abi_input_types_cache: Dict[int, Tuple[List[Dict[str, Any]], Tuple[str, ...]]] = {}
+
+
+def get_abi_input_types(inputs: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    try:
+        return _abi_input_types_cache[id(inputs)][1]
+    except KeyError:
+        pass
+
+    types = tuple(
+        eth_utils.abi.collapse_if_tuple(cast(Dict[str, Any], arg))
+        for arg in fix_library_abi(inputs)
+    )
+    _abi_input_types_cache[id(inputs)] = (inputs, types)
+    return types
+
+
 class Abi:
     @staticmethod
     def _normalize_input(arguments: Iterable) -> List:
@@ -222,14 +260,9 @@ class Abi:
         selector = func.selector
         contract = get_class_that_defined_method(func)
         assert selector in contract._abi  # pyright: ignore reportGeneralTypeIssues
-        types = [
-            eth_utils.abi.collapse_if_tuple(cast(Dict[str, Any], arg))
-            for arg in fix_library_abi(
-                contract._abi[selector][  # pyright: ignore reportGeneralTypeIssues
-                    "inputs"
-                ]
-            )
-        ]
+        types = get_abi_input_types(
+            contract._abi[selector]["inputs"]  # pyright: ignore reportGeneralTypeIssues
+        )
         return cls.encode_with_selector(selector, types, arguments)
 
     @classmethod
@@ -1097,24 +1130,37 @@ def check_connected(f):
 
 
 _private_keys_index: Dict[Address, bytes] = {}
+_WEB3_PASSTHROUGH_TYPES = frozenset({int, bool, bytes, str, Wei})
 _test_accounts_generated_count: int = 0
 
 
+class ChainSnapshot(NamedTuple):
+    nonces: KeyedDefaultDict[str, int]  # pyright: ignore reportGeneralTypeIssues
+    accounts: List[Account]
+    default_call_account: Optional[Account]
+    default_tx_account: Optional[Account]
+    txs: ChainMap[str, TransactionAbc]
+    blocks: ChainMap[int, Block]
+    block_gas_limit: Optional[int]  # None in deployment, read from the chain there
+
+
 class Chain(ABC):
     _connected: bool
     _chain_interface: ChainInterfaceAbc
     _accounts: List[Account]
     _accounts_set: Set[Account]  # for faster lookup
-    _nonces: KeyedDefaultDict[Address, int]  # pyright: ignore reportGeneralTypeIssues
+    # keyed by lowercase address
+    _nonces: KeyedDefaultDict[str, int]  # pyright: ignore reportGeneralTypeIssues
     _default_call_account: Optional[Account]
     _default_tx_account: Optional[Account]
     _default_estimate_account: Optional[Account]
     _default_access_list_account: Optional[Account]
+    _default_senders: Dict[RequestType, str]  # str(address) of the default accounts
     _default_tx_type: int
     _default_tx_confirmations: int
     _deployed_libraries: DefaultDict[bytes, List[Library]]
     _single_source_errors: Set[bytes]
-    _snapshots: Dict[str, Dict]
+    _snapshots: Dict[str, ChainSnapshot]
     _blocks: ChainBlocks
     _txs: ChainTransactions
     _chain_id: int
@@ -1387,7 +1433,7 @@ class Chain(ABC):
             self._accounts_set = set(self._accounts)
             self._nonces = KeyedDefaultDict(
                 lambda addr: self._chain_interface.get_transaction_count(  # pyright: ignore reportGeneralTypeIssues
-                    str(addr)
+                    addr
                 )
             )
             self._snapshots = {}
@@ -1465,6 +1511,7 @@ class Chain(ABC):
             self._default_call_account = account
         else:
             self._default_call_account = Account(account, self)
+        self._update_default_senders()
 
     @property
     @check_connected
@@ -1480,6 +1527,7 @@ class Chain(ABC):
             self._default_tx_account = account
         else:
             self._default_tx_account = Account(account, self)
+        self._update_default_senders()
 
     @property
     @check_connected
@@ -1495,6 +1543,7 @@ class Chain(ABC):
             self._default_estimate_account = account
         else:
             self._default_estimate_account = Account(account, self)
+        self._update_default_senders()
 
     @property
     @check_connected
@@ -1512,6 +1561,7 @@ class Chain(ABC):
             self._default_access_list_account = account
         else:
             self._default_access_list_account = Account(account, self)
+        self._update_default_senders()
 
     @property
     @check_connected
@@ -1623,6 +1673,7 @@ class Chain(ABC):
         self._default_tx_account = account
         self._default_estimate_account = account
         self._default_access_list_account = account
+        self._update_default_senders()
 
     @check_connected
     def reset(self) -> None:
@@ -1667,11 +1718,27 @@ class Chain(ABC):
         finally:
             self.revert(snapshot_id)
 
-    def _update_nonce(self, address: Address, nonce: int) -> None:
-        self._nonces[address] = nonce
+    def _update_default_senders(self) -> None:
+        # must be called whenever any of the default accounts changes
+        self._default_senders = {
+            request_type: str(account.address)
+            for request_type, account in (
+                (RequestType.CALL, self._default_call_account),
+                (RequestType.TX, self._default_tx_account),
+                (RequestType.ESTIMATE, self._default_estimate_account),
+                (RequestType.ACCESS_LIST, self._default_access_list_account),
+            )
+            if account is not None
+        }
+
+    def _update_nonce(self, address: Union[Address, str], nonce: int) -> None:
+        self._nonces[str(address).lower()] = nonce
 
     def _convert_to_web3_type(self, value: Any) -> Any:
-        if dataclasses.is_dataclass(value):
+        if type(value) in _WEB3_PASSTHROUGH_TYPES:
+            # fast path for the most common argument types, no conversion needed
+            return value
+        elif dataclasses.is_dataclass(value):
             return tuple(
                 self._convert_to_web3_type(getattr(value, f.name))
                 for f in dataclasses.fields(value)
@@ -2104,7 +2171,7 @@ class Chain(ABC):
                 raise ValueError(
                     f"Private key for account {tx_params['from']} not known and is not owned by the connected client either."
                 )
-            self._update_nonce(Address(tx_params["from"]), tx_params["nonce"] + 1)
+            self._update_nonce(tx_params["from"], tx_params["nonce"] + 1)
         else:
             if isinstance(self.chain_interface, AnvilChainInterface):
                 try:
@@ -2114,7 +2181,7 @@ class Chain(ABC):
                         tx_hash = e.args[0]["data"]["txHash"]
                     except Exception:
                         raise e
-                self._update_nonce(Address(tx_params["from"]), tx_params["nonce"] + 1)
+                self._update_nonce(tx_params["from"], tx_params["nonce"] + 1)
             else:
                 sender = Account(tx_params["from"], self)
 
@@ -1,8 +1,9 @@
+import itertools
 import json
 import logging
 import platform
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from wake.config import WakeConfig
 from wake.core import get_logger
@@ -10,19 +11,31 @@ from wake.core import get_logger
 from .abc import ProtocolAbc
 from .http import HttpProtocol
 from .ipc import IpcProtocol
+from .serialization import json_dumps
 from .websocket import WebsocketProtocol
 
 logger = get_logger(__name__)
 
+# method names are plain identifiers, only params need to go through the JSON encoder
+_REQUEST_TEMPLATE = b'{"jsonrpc":"2.0","method":"%b","params":%b,"id":%d}'
+# requests without params differ only in id, everything before it is built once per method
+_NO_PARAMS_REQUEST_PREFIX_TEMPLATE = b'{"jsonrpc":"2.0","method":"%b","params":[],"id":'
+_no_params_request_prefixes: Dict[str, bytes] = {}
+
 
 class JsonRpcError(Exception):
     def __init__(self, data: Dict):
         self.data = data
 
 
+class JsonRpcBatchRejectedError(JsonRpcError):
+    pass
+
+
 class JsonRpcCommunicator:
     _protocol: ProtocolAbc
-    _request_id: int
+    _request_ids: Iterator[int]
+    _max_batch_size: int
     _connected: bool
 
     def __init__(self, config: WakeConfig, uri: str):
@@ -30,12 +43,18 @@ class JsonRpcCommunicator:
             self._protocol = HttpProtocol(uri, config.general.json_rpc_timeout)
         elif uri.startswith(("ws://", "wss://")):
             self._protocol = WebsocketProtocol(uri, config.general.json_rpc_timeout)
+        elif uri.startswith("unix://"):
+            self._protocol = IpcProtocol(
+                uri[len("unix://") :], config.general.json_rpc_timeout
+            )
         elif Path(uri).is_socket() or platform.system() == "Windows":
             self._protocol = IpcProtocol(uri, config.general.json_rpc_timeout)
         else:
             raise ValueError(f"Invalid URI: {uri}")
 
-        self._request_id = 0
+        # some providers (e.g. Blockscout) reject id 0
+        self._request_ids = itertools.count(1)
+        self._max_batch_size = config.general.json_rpc_max_batch_size
         self._connected = False
 
     def __enter__(self):
@@ -52,17 +71,81 @@ class JsonRpcCommunicator:
         return self._connected
 
     def send_request(self, method_name: str, params: Optional[List] = None) -> Any:
-        post_data = {
-            "jsonrpc": "2.0",
-            "method": method_name,
-            "params": params if params is not None else [],
-            "id": self._request_id,
-        }
-        logger.info(f"Sending request:\n{post_data}")
-        self._request_id += 1
-
-        response = self._protocol.send_recv(json.dumps(post_data))
-        logger.info(f"Received response:\n{json.dumps(response)}")
+        if params is None:
+            try:
+                prefix = _no_params_request_prefixes[method_name]
+            except KeyError:
+                prefix = _NO_PARAMS_REQUEST_PREFIX_TEMPLATE % method_name.encode(
+                    "utf-8"
+                )
+                _no_params_request_prefixes[method_name] = prefix
+            post_data = prefix + b"%d}" % next(self._request_ids)
+        else:
+            post_data = _REQUEST_TEMPLATE % (
+                method_name.encode("utf-8"),
+                json_dumps(params),
+                next(self._request_ids),
+            )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending request:\n%s", post_data.decode("utf-8"))
+
+        response = self._protocol.send_recv(post_data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received response:\n%s", json.dumps(response))
         if "error" in response:
             raise JsonRpcError(response["error"])
         return response["result"]
+
+    def send_batch_request(
+        self, requests: Sequence[Tuple[str, Optional[List]]]
+    ) -> List[Any]:
+        # providers limit the batch size, larger batches are split into multiple round trips
+        results = []
+        for i in range(0, len(requests), self._max_batch_size):
+            results.extend(self._send_batch(requests[i : i + self._max_batch_size]))
+        return results
+
+    def _send_batch(self, requests: Sequence[Tuple[str, Optional[List]]]) -> List[Any]:
+        # all requests are sent in a single round trip, results are returned in order
+        request_ids = []
+        parts = []
+        for method_name, params in requests:
+            request_id = next(self._request_ids)
+            parts.append(
+                _REQUEST_TEMPLATE
+                % (
+                    method_name.encode("utf-8"),
+                    json_dumps(params) if params is not None else b"[]",
+                    request_id,
+                )
+            )
+            request_ids.append(request_id)
+        post_data = b"[" + b",".join(parts) + b"]"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending batch request:\n%s", post_data.decode("utf-8"))
+
+        response = self._protocol.send_recv(post_data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received batch response:\n%s", json.dumps(response))
+        if isinstance(response, dict):
+            # the whole batch was rejected (e.g. batching not supported)
+            raise JsonRpcBatchRejectedError(response.get("error", response))
+
+        # responses may come in any order
+        responses_by_id = {r.get("id"): r for r in response}
+        results = []
+        for request_id, (method_name, _) in zip(request_ids, requests):
+            r = responses_by_id.get(request_id)
+            if r is None:
+                # the node may omit a response or answer an invalid request with "id": null
+                error = {
+                    "code": -32603,
+                    "message": f"Missing response to batched {method_name} request with id {request_id}",
+                }
+                if None in responses_by_id:
+                    error["data"] = responses_by_id[None].get("error")
+                raise JsonRpcError(error)
+            if "error" in r:
+                raise JsonRpcError(r["error"])
+            results.append(r["result"])
+        return results
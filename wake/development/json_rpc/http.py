@@ -1,34 +1,150 @@
-import json
-from urllib.request import Request, urlopen
+import http.client
+import io
+import select
+from typing import Dict, Optional, Type
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from wake.utils import get_package_version
 
 from .abc import ProtocolAbc
+from .serialization import json_loads
+
+
+def _is_connection_dropped(connection: http.client.HTTPConnection) -> bool:
+    if connection.sock is None:
+        return True
+    # an idle keep-alive socket only becomes readable when the server closes it;
+    # POSIX select() fails for file descriptors >= FD_SETSIZE, Windows has no poll()
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(connection.sock, select.POLLIN)
+        return len(poller.poll(0)) > 0
+    readable, _, _ = select.select([connection.sock], [], [], 0)
+    return len(readable) > 0
 
 
 class HttpProtocol(ProtocolAbc):
     _uri: str
     _timeout: float
+    _connection_cls: Type[http.client.HTTPConnection]
+    _host: str
+    _port: Optional[int]
+    _path: str
+    _headers: Dict[str, str]
+    # proxies from HTTP(S)_PROXY environment variables are only handled by urllib
+    _use_urllib: bool
+    # kept open between requests (HTTP/1.1 keep-alive), created lazily
+    _connection: Optional[http.client.HTTPConnection]
 
     def __init__(self, uri: str, timeout: float):
         self._uri = uri
         self._timeout = timeout
 
+        parsed = urlsplit(uri)
+        self._connection_cls = (
+            http.client.HTTPSConnection
+            if parsed.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parsed.hostname or ""
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        if parsed.query:
+            self._path += "?" + parsed.query
+        self._headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "User-Agent": f"wake/{get_package_version('eth-wake')}",
+        }
+        self._use_urllib = parsed.scheme in getproxies() and not proxy_bypass(
+            parsed.netloc
+        )
+        self._connection = None
+
     def __enter__(self):
         pass
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
-    def send_recv(self, data: str):
+    def _send_recv_urllib(self, data: bytes):
         req = Request(
             self._uri,
-            data.encode("utf-8"),
+            data,
             headers={
                 "Content-Type": "application/json",
-                "User-Agent": f"wake/{get_package_version('eth-wake')}",
+                "User-Agent": self._headers["User-Agent"],
             },
         )
 
         with urlopen(req, timeout=self._timeout) as response:
-            return json.loads(response.read().decode("utf-8"))
+            return json_loads(response.read())
+
+    def _send(self, data: bytes) -> None:
+        if self._connection is not None and _is_connection_dropped(self._connection):
+            self._close()
+
+        reused = self._connection is not None
+        if self._connection is None:
+            self._connection = self._connection_cls(
+                self._host, self._port, timeout=self._timeout
+            )
+
+        try:
+            self._connection.request("POST", self._path, data, self._headers)
+            return
+        except ConnectionError as e:
+            self._close()
+            # the server closed the reused connection before it got the request,
+            # the request was not processed and can be sent again on a fresh connection
+            if not reused:
+                raise URLError(e) from e
+        except (http.client.HTTPException, OSError) as e:
+            self._close()
+            raise URLError(e) from e
+
+        self._connection = self._connection_cls(
+            self._host, self._port, timeout=self._timeout
+        )
+        try:
+            self._connection.request("POST", self._path, data, self._headers)
+        except (http.client.HTTPException, OSError) as e:
+            self._close()
+            raise URLError(e) from e
+
+    def send_recv(self, data: bytes):
+        if self._use_urllib:
+            return self._send_recv_urllib(data)
+
+        self._send(data)
+        assert self._connection is not None
+
+        # never resend from here on, the server may have already processed the request
+        try:
+            response = self._connection.getresponse()
+            raw = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            self._close()
+            raise URLError(e) from e
+
+        if response.will_close:
+            self._close()
+
+        # keep the same behavior as urllib.request.urlopen
+        if not 200 <= response.status < 300:
+            raise HTTPError(
+                self._uri,
+                response.status,
+                response.reason,
+                response.headers,  # pyright: ignore reportGeneralTypeIssues
+                io.BytesIO(raw),
+            )
+
+        return json_loads(raw)
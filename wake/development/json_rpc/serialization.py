@@ -0,0 +1,40 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)  # pyright: ignore reportOptionalMemberAccess
+        except TypeError:
+            # orjson does not support integers wider than 64 bits and non-str keys
+            return json.dumps(obj).encode("utf-8")
+
+    # orjson silently turns integers wider than 64 bits into floats, payloads with
+    # a 19+ digit number are left to the exact stdlib parser; digits inside hex strings
+    # never follow one of ":,[- \t\r\n" and do not match
+    _NUMBER_START_TABLE = bytes.maketrans(
+        b"0123456789:,[- \t\r\n", b"0" * 10 + b"S" * 8
+    )
+    _LONG_NUMBER = b"S" + b"0" * 19
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if _LONG_NUMBER in data.translate(_NUMBER_START_TABLE):
+            return json.loads(data)
+        return orjson.loads(data)  # pyright: ignore reportOptionalMemberAccess
+
+else:
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
@@ -1,8 +1,7 @@
-import json
-
 from websocket import WebSocket, create_connection
 
 from .abc import ProtocolAbc
+from .serialization import json_loads
 
 
 class WebsocketProtocol(ProtocolAbc):
@@ -22,6 +21,8 @@ class WebsocketProtocol(ProtocolAbc):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._ws.close()
 
-    def send_recv(self, data: str):
+    def send_recv(self, data: bytes):
         self._ws.send(data)  # pyright: ignore reportGeneralTypeIssues
-        return json.loads(self._ws.recv())
+        # raw frame payload, parsed without decoding it to str first
+        _, data = self._ws.recv_data()
+        return json_loads(data)
@@ -3,7 +3,9 @@ from __future__ import annotations
 import functools
 import importlib
 import inspect
+import time
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from contextlib import contextmanager
 from dataclasses import dataclass, field, fields
 from enum import IntEnum
@@ -13,6 +15,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -86,11 +89,12 @@ def _fetch_tx_receipt(f):
 
 class ChainTransactions:
     _chain: Chain
-    _transactions: Dict[str, TransactionAbc]
+    # new layer is pushed on every snapshot, see Chain.snapshot
+    _transactions: ChainMap[str, TransactionAbc]
 
     def __init__(self, chain: Chain):
         self._chain = chain
-        self._transactions = {}
+        self._transactions = ChainMap()
 
     def __getitem__(self, key: str) -> TransactionAbc:
         if not key.startswith("0x"):
@@ -880,3 +884,44 @@ def on_revert(callback: Callable[[TransactionRevertedError], None]):
         return wrapper
 
     return decorator
+
+
+def wait_for_transactions(
+    txs: Iterable[TransactionAbc], poll_interval: float = 0.001
+) -> Iterator[TransactionAbc]:
+    # yields each tx as soon as it is mined, receipts of all still pending txs
+    # of a chain are fetched in a single JSON-RPC batch request per poll
+    pending: Dict[Chain, List[TransactionAbc]] = {}
+    for tx in txs:
+        if tx._tx_receipt is not None:
+            yield tx
+        else:
+            pending.setdefault(tx.chain, []).append(tx)
+
+    sleep_interval = poll_interval
+    while len(pending) > 0:
+        mined = False
+        for chain, chain_txs in list(pending.items()):
+            receipts = chain.chain_interface.get_transaction_receipts(
+                [tx.tx_hash for tx in chain_txs]
+            )
+            still_pending = []
+            for tx, receipt in zip(chain_txs, receipts):
+                if receipt is None:
+                    still_pending.append(tx)
+                else:
+                    tx._tx_receipt = receipt
+                    mined = True
+                    yield tx
+
+            if len(still_pending) > 0:
+                pending[chain] = still_pending
+            else:
+                del pending[chain]
+
+        if len(pending) > 0:
+            # back off while nothing gets mined, capped at 1 second
+            if mined:
+                sleep_interval = poll_interval
+            time.sleep(sleep_interval)
+            sleep_interval = min(sleep_interval * 2, 1.0)
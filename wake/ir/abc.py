@@ -25,6 +25,15 @@ class IrAbc(ABC):
 
     """
 
+    __slots__ = (
+        "_source",
+        "_ast_node",
+        "_parent",
+        "_depth",
+        "_source_unit",
+        "_reference_resolver",
+    )
+
     _source: bytes
     _ast_node: SolcNode
     _parent: Optional[IrAbc]
@@ -127,6 +136,8 @@ class SolidityAbc(IrAbc, ABC):
     Abstract base class for all Solidity IR nodes.
     """
 
+    __slots__ = ()
+
     _ast_node: SolidityNode
 
     def __init__(
@@ -45,6 +45,8 @@ class DeclarationAbc(SolidityAbc, ABC):
     Abstract base class for all Solidity declarations.
     """
 
+    __slots__ = ("_name", "_name_location", "_references")
+
     _name: str
     _name_location: Optional[Tuple[int, int]]
     _references: Set[
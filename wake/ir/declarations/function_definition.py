@@ -40,6 +40,17 @@ from wake.ir.meta.parameter_list import ParameterList
 from wake.ir.meta.structured_documentation import StructuredDocumentation
 from wake.ir.utils import IrInitTuple
 
+IDENTIFIER = r"[a-zA-Z$_][a-zA-Z0-9$_]*"
+FUNCTION_RE = re.compile(
+    r"^\s*function\s+(?P<name>{identifier})".format(identifier=IDENTIFIER).encode(
+        "utf-8"
+    )
+)
+CONSTRUCTOR_RE = re.compile(r"^\s*(?P<name>constructor)".encode("utf-8"))
+FALLBACK_RE = re.compile(r"^\s*(?P<name>fallback)".encode("utf-8"))
+RECEIVE_RE = re.compile(r"^\s*(?P<name>receive)".encode("utf-8"))
+NAME_RES = (FUNCTION_RE, CONSTRUCTOR_RE, FALLBACK_RE, RECEIVE_RE)
+
 
 class FunctionDefinition(DeclarationAbc):
     """
@@ -87,16 +98,33 @@ class FunctionDefinition(DeclarationAbc):
         ```
     """
 
+    __slots__ = (
+        "_child_functions",
+        "_implemented",
+        "_kind",
+        "_modifiers",
+        "_parameters",
+        "_return_parameters",
+        "_state_mutability",
+        "_virtual",
+        "_visibility",
+        "_base_functions",
+        "_documentation",
+        "_function_selector",
+        "_body",
+        "_overrides",
+    )
+
     _ast_node: SolcFunctionDefinition
     _parent: Union[ContractDefinition, SourceUnit]
     _child_functions: Set[Union[FunctionDefinition, VariableDeclaration]]
 
     _implemented: bool
     _kind: FunctionKind
-    _modifiers: List[ModifierInvocation]
+    _modifiers: Tuple[ModifierInvocation, ...]
     _parameters: ParameterList
     _return_parameters: ParameterList
-    # __scope
+    # _scope
     _state_mutability: StateMutability
     _virtual: bool
     _visibility: Visibility
@@ -122,12 +150,12 @@ class FunctionDefinition(DeclarationAbc):
         elif self._kind == FunctionKind.RECEIVE:
             self._name = "receive"
 
-        self._modifiers = [
+        self._modifiers = tuple(
             ModifierInvocation(init, modifier, self) for modifier in function.modifiers
-        ]
+        )
         self._parameters = ParameterList(init, function.parameters, self)
         self._return_parameters = ParameterList(init, function.return_parameters, self)
-        # self.__scope = function.scope
+        # self._scope = function.scope
         self._state_mutability = function.state_mutability
         self._virtual = function.virtual
         self._visibility = function.visibility
@@ -167,7 +195,10 @@ class FunctionDefinition(DeclarationAbc):
             if function.overrides
             else None
         )
-        self._reference_resolver.register_post_process_callback(self._post_process)
+
+        self._reference_resolver.register_post_process_batch_item(
+            FunctionDefinition._post_process_batch, self
+        )
 
     def __iter__(self) -> Iterator[IrAbc]:
         yield self
@@ -182,36 +213,29 @@ class FunctionDefinition(DeclarationAbc):
         if self._overrides is not None:
             yield from self._overrides
 
-    def _post_process(self, callback_params: CallbackParams):
-        base_functions = self.base_functions
-        for base_function in base_functions:
-            base_function._child_functions.add(self)
-        self._reference_resolver.register_destroy_callback(
-            self.source_unit.file, partial(self._destroy, base_functions)
-        )
+    @staticmethod
+    def _post_process_batch(
+        callback_params: CallbackParams, functions: List[FunctionDefinition]
+    ):
+        for function in functions:
+            base_functions = function.base_functions
+            for base_function in base_functions:
+                base_function._child_functions.add(function)
+            function._reference_resolver.register_destroy_callback(
+                function.source_unit.file, partial(function._destroy, base_functions)
+            )
 
     def _destroy(self, base_functions: Tuple[FunctionDefinition, ...]) -> None:
         for base_function in base_functions:
             base_function._child_functions.remove(self)
 
     def _parse_name_location(self) -> Tuple[int, int]:
-        IDENTIFIER = r"[a-zA-Z$_][a-zA-Z0-9$_]*"
-        FUNCTION_RE = re.compile(
-            r"^\s*function\s+(?P<name>{identifier})".format(
-                identifier=IDENTIFIER
-            ).encode("utf-8")
-        )
-        CONSTRUCTOR_RE = re.compile(r"^\s*(?P<name>constructor)".encode("utf-8"))
-        FALLBACK_RE = re.compile(r"^\s*(?P<name>fallback)".encode("utf-8"))
-        RECEIVE_RE = re.compile(r"^\s*(?P<name>receive)".encode("utf-8"))
-
-        regexps = [FUNCTION_RE, CONSTRUCTOR_RE, FALLBACK_RE, RECEIVE_RE]
-        matches = [regexp.match(self._source) for regexp in regexps]
-        assert any(matches)
-
         byte_start = self._ast_node.src.byte_offset
-        match = next(match for match in matches if match)
-        return byte_start + match.start("name"), byte_start + match.end("name")
+        for regexp in NAME_RES:
+            match = regexp.match(self._source)
+            if match:
+                return byte_start + match.start("name"), byte_start + match.end("name")
+        raise AssertionError("Could not parse function name location")
 
     def get_all_references(
         self, include_declarations: bool
@@ -263,9 +287,8 @@ class FunctionDefinition(DeclarationAbc):
     @property
     @lru_cache(maxsize=2048)
     def canonical_name(self) -> str:
-        from .contract_definition import ContractDefinition
-
-        if isinstance(self._parent, ContractDefinition):
+        # parent is either ContractDefinition or SourceUnit, only the former is a declaration
+        if isinstance(self._parent, DeclarationAbc):
             return f"{self._parent.canonical_name}.{self._name}({','.join(param.type_name.type_string for param in self._parameters.parameters)})"
         return f"{self._name}({','.join(param.type_name.type_string for param in self._parameters.parameters)})"
 
@@ -368,7 +391,7 @@ class FunctionDefinition(DeclarationAbc):
         Returns:
             List of modifiers applied to the function.
         """
-        return tuple(self._modifiers)
+        return self._modifiers
 
     @property
     def parameters(self) -> ParameterList:
@@ -411,6 +434,7 @@ class FunctionDefinition(DeclarationAbc):
         return self._visibility
 
     @property
+    @lru_cache(maxsize=2048)
     def base_functions(self) -> Tuple[FunctionDefinition, ...]:
         """
         !!! example
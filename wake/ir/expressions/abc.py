@@ -43,6 +43,8 @@ class ExpressionAbc(SolidityAbc, ABC):
     > Something that has a value.
     """
 
+    __slots__ = ("_type_descriptions",)
+
     _type_descriptions: TypeDescriptionsModel
 
     def __init__(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import lru_cache, reduce
 from operator import or_
-from typing import TYPE_CHECKING, Iterator, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Set, Tuple, Union
 
 from wake.core import get_logger
 from wake.ir.abc import IrAbc, SolidityAbc
@@ -54,13 +54,15 @@ class FunctionCall(ExpressionAbc):
     - variable getter calls.
     """
 
+    __slots__ = ("_arguments", "_expression", "_kind", "_names", "_try_call")
+
     _ast_node: SolcFunctionCall
     _parent: SolidityAbc  # TODO: make this more specific
 
-    _arguments: List[ExpressionAbc]
+    _arguments: Tuple[ExpressionAbc, ...]
     _expression: ExpressionAbc
     _kind: FunctionCallKind
-    _names: List[str]
+    _names: Tuple[str, ...]
     _try_call: bool
 
     def __init__(
@@ -68,14 +70,14 @@ class FunctionCall(ExpressionAbc):
     ):
         super().__init__(init, function_call, parent)
         self._kind = function_call.kind
-        self._names = list(function_call.names)
+        self._names = tuple(function_call.names)
         self._try_call = function_call.try_call
 
         self._expression = ExpressionAbc.from_ast(init, function_call.expression, self)
-        self._arguments = [
+        self._arguments = tuple(
             ExpressionAbc.from_ast(init, argument, self)
             for argument in function_call.arguments
-        ]
+        )
 
     def __iter__(self) -> Iterator[IrAbc]:
         yield self
@@ -116,7 +118,7 @@ class FunctionCall(ExpressionAbc):
         Returns:
             Tuple of names of the named arguments in the order they appear in the source code.
         """
-        return tuple(self._names)
+        return self._names
 
     @property
     def try_call(self) -> bool:
@@ -146,7 +148,7 @@ class FunctionCall(ExpressionAbc):
         Returns:
             Tuple of arguments of the function call in the order they appear in the source code.
         """
-        return tuple(self._arguments)
+        return self._arguments
 
     @property
     @lru_cache(maxsize=2048)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from functools import lru_cache, reduce
+from itertools import chain
 from operator import or_
-from typing import TYPE_CHECKING, Iterator, List, Set, Tuple, Union
+from typing import TYPE_CHECKING, Iterator, Set, Tuple, Union
 
 from wake.ir.abc import IrAbc, SolidityAbc
 from wake.ir.ast import SolcFunctionCallOptions
@@ -30,12 +31,14 @@ class FunctionCallOptions(ExpressionAbc):
         ```
     """
 
+    __slots__ = ("_expression", "_names", "_options")
+
     _ast_node: SolcFunctionCallOptions
     _parent: SolidityAbc  # TODO: make this more specific
 
     _expression: ExpressionAbc
-    _names: List[str]
-    _options: List[ExpressionAbc]
+    _names: Tuple[str, ...]
+    _options: Tuple[ExpressionAbc, ...]
 
     def __init__(
         self,
@@ -47,17 +50,16 @@ class FunctionCallOptions(ExpressionAbc):
         self._expression = ExpressionAbc.from_ast(
             init, function_call_options.expression, self
         )
-        self._names = list(function_call_options.names)
-        self._options = [
+        self._names = tuple(function_call_options.names)
+        self._options = tuple(
             ExpressionAbc.from_ast(init, option, self)
             for option in function_call_options.options
-        ]
+        )
 
     def __iter__(self) -> Iterator[IrAbc]:
         yield self
-        yield from self._expression
-        for option in self._options:
-            yield from option
+        # single delegation through a C-level iterator instead of one per child
+        yield from chain(self._expression, *self._options)
 
     @property
     def parent(self) -> SolidityAbc:
@@ -87,7 +89,7 @@ class FunctionCallOptions(ExpressionAbc):
         Returns:
             Names of the function call options in the order they appear in the source code.
         """
-        return tuple(self._names)
+        return self._names
 
     @property
     def options(self) -> Tuple[ExpressionAbc, ...]:
@@ -95,7 +97,7 @@ class FunctionCallOptions(ExpressionAbc):
         Returns:
             Values of the function call options in the order they appear in the source code.
         """
-        return tuple(self._options)
+        return self._options
 
     @property
     def is_ref_to_state_variable(self) -> bool:
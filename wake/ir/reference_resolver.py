@@ -4,9 +4,11 @@ import heapq
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     DefaultDict,
     Dict,
@@ -65,6 +67,7 @@ class ReferenceResolver:
     _registered_source_files: DefaultDict[bytes, Dict[int, Path]]
     _registered_nodes: Dict[Tuple[Path, int], SolidityAbc]
     _post_process_callbacks: List[PostProcessQueueItem]
+    _post_process_batches: Dict[Callable[[CallbackParams, List[Any]], None], List[Any]]
     _destroy_callbacks: DefaultDict[Path, List[Callable[[], None]]]
     _global_symbol_references: DefaultDict[
         GlobalSymbol, List[Union[Identifier, MemberAccess]]
@@ -77,6 +80,7 @@ class ReferenceResolver:
         self._registered_source_files = defaultdict(dict)
         self._registered_nodes = {}
         self._post_process_callbacks = []
+        self._post_process_batches = {}
         self._destroy_callbacks = defaultdict(list)
         self._global_symbol_references = defaultdict(list)
         self._node_types = {}
@@ -225,6 +229,27 @@ class ReferenceResolver:
             self._post_process_callbacks, PostProcessQueueItem(priority, callback)
         )
 
+    def register_post_process_batch_item(
+        self,
+        callback: Callable[[CallbackParams, List[Any]], None],
+        item: Any,
+        priority: int = 0,
+    ):
+        batch = self._post_process_batches.get(callback)
+        if batch is None:
+            batch = self._post_process_batches[callback] = []
+            self.register_post_process_callback(
+                partial(self._run_post_process_batch, callback), priority
+            )
+        batch.append(item)
+
+    def _run_post_process_batch(
+        self,
+        callback: Callable[[CallbackParams, List[Any]], None],
+        callback_params: CallbackParams,
+    ):
+        callback(callback_params, self._post_process_batches.pop(callback))
+
     def register_destroy_callback(self, file: Path, callback: Callable[[], None]):
         self._destroy_callbacks[file].append(callback)
 
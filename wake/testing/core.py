@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 import random
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-import eth_utils
 from Crypto.Hash import keccak
 
 import wake.development.core
 from wake.development.chain_interfaces import TxParams
 from wake.development.core import (
+    TX_TYPE_FORBIDDEN_PARAMS,
     Abi,
     Account,
-    Address,
+    ChainSnapshot,
     RequestType,
     RevertToSnapshotFailedError,
     Wei,
     check_connected,
-    fix_library_abi,
+    get_abi_input_types,
 )
 from wake.development.globals import chain_interfaces_manager
 from wake.development.json_rpc import JsonRpcError
@@ -25,6 +26,9 @@ from wake.development.json_rpc import JsonRpcError
 from ..development.chain_interfaces import AnvilChainInterface
 from ..development.transactions import TransactionAbc, TransactionStatusEnum
 
+_WAIT_INITIAL_SLEEP_INTERVAL = 0.001
+_WAIT_MAX_SLEEP_INTERVAL = 0.05
+
 
 class Chain(wake.development.core.Chain):
     _block_gas_limit: int
@@ -92,15 +96,19 @@ class Chain(wake.development.core.Chain):
     def snapshot(self) -> str:
         snapshot_id = self._chain_interface.snapshot()
 
-        self._snapshots[snapshot_id] = {
-            "nonces": self._nonces.copy(),
-            "accounts": self._accounts.copy(),
-            "default_call_account": self._default_call_account,
-            "default_tx_account": self._default_tx_account,
-            "block_gas_limit": self._block_gas_limit,
-            "txs": dict(self._txs._transactions),
-            "blocks": dict(self._blocks._blocks),
-        }
+        self._snapshots[snapshot_id] = ChainSnapshot(
+            nonces=self._nonces.copy(),
+            accounts=self._accounts.copy(),
+            default_call_account=self._default_call_account,
+            default_tx_account=self._default_tx_account,
+            txs=self._txs._transactions,
+            blocks=self._blocks._blocks,
+            block_gas_limit=self._block_gas_limit,
+        )
+        # copy-on-write: the saved maps are never written to again,
+        # new entries go to a fresh layer that is dropped on revert
+        self._txs._transactions = self._txs._transactions.new_child()
+        self._blocks._blocks = self._blocks._blocks.new_child()
         return snapshot_id
 
     @check_connected
@@ -110,13 +118,14 @@ class Chain(wake.development.core.Chain):
             raise RevertToSnapshotFailedError()
 
         snapshot = self._snapshots[snapshot_id]
-        self._nonces = snapshot["nonces"]
-        self._accounts = snapshot["accounts"]
-        self._default_call_account = snapshot["default_call_account"]
-        self._default_tx_account = snapshot["default_tx_account"]
-        self._block_gas_limit = snapshot["block_gas_limit"]
-        self._txs._transactions = snapshot["txs"]
-        self._blocks._blocks = snapshot["blocks"]
+        self._nonces = snapshot.nonces
+        self._accounts = snapshot.accounts
+        self._default_call_account = snapshot.default_call_account
+        self._default_tx_account = snapshot.default_tx_account
+        self._update_default_senders()
+        self._block_gas_limit = snapshot.block_gas_limit
+        self._txs._transactions = snapshot.txs
+        self._blocks._blocks = snapshot.blocks
         del self._snapshots[snapshot_id]
 
     @property
@@ -158,95 +167,62 @@ class Chain(wake.development.core.Chain):
         abi: Optional[Dict],
     ) -> TxParams:
         tx_type = params.get("type", self._default_tx_type)
-        if tx_type not in {0, 1, 2}:
-            raise ValueError("Invalid transaction type")
-
-        if tx_type == 0 and (
-            "accessList" in params
-            or "maxFeePerGas" in params
-            or "maxPriorityFeePerGas" in params
-        ):
-            raise ValueError(
-                "Cannot specify accessList, maxFeePerGas, or maxPriorityFeePerGas for type 0 transaction"
-            )
-        elif tx_type == 1 and (
-            "maxFeePerGas" in params or "maxPriorityFeePerGas" in params
-        ):
-            raise ValueError(
-                "Cannot specify maxFeePerGas or maxPriorityFeePerGas for type 1 transaction"
-            )
-        elif tx_type == 2 and "gasPrice" in params:
-            raise ValueError("Cannot specify gasPrice for type 2 transaction")
-
-        if "from" in params:
-            sender = params["from"]
-        else:
-            if request_type == "call" and self.default_call_account is not None:
-                sender = str(self.default_call_account.address)
-            elif request_type == "tx" and self.default_tx_account is not None:
-                sender = str(self.default_tx_account.address)
-            elif (
-                request_type == "estimate" and self.default_estimate_account is not None
-            ):
-                sender = str(self.default_estimate_account.address)
-            elif (
-                request_type == "access_list"
-                and self.default_access_list_account is not None
-            ):
-                sender = str(self.default_access_list_account.address)
-            else:
+        try:
+            forbidden_params, error_message = TX_TYPE_FORBIDDEN_PARAMS[tx_type]
+        except KeyError:
+            raise ValueError("Invalid transaction type") from None
+        if not forbidden_params.isdisjoint(params):
+            raise ValueError(error_message)
+
+        # None is never a valid value for these keys, so it marks a missing key
+        sender = params.get("from")
+        access_list = params.get("accessList")
+        gas = params.get("gas")
+
+        if sender is None:
+            try:
+                sender = self._default_senders[request_type]
+            except KeyError:
                 raise ValueError(
                     "No from_ account specified and no default account set"
-                )
-
-        if "data" not in params:
-            params["data"] = b""
+                ) from None
 
-        if abi is None:
-            params["data"] += Abi.encode([], [])
-        else:
+        data = params.get("data", b"")
+        # without an ABI there are no arguments to encode (Abi.encode([], []) == b"")
+        if abi is not None:
             arguments = [self._convert_to_web3_type(arg) for arg in arguments]
-            types = [
-                eth_utils.abi.collapse_if_tuple(cast(Dict[str, Any], arg))
-                for arg in fix_library_abi(abi["inputs"])
-            ]
-            params["data"] += Abi.encode(types, arguments)
+            data += Abi.encode(get_abi_input_types(abi["inputs"]), arguments)
 
         tx: TxParams = {
-            "nonce": self._nonces[Address(sender)],
+            "nonce": self._nonces[sender.lower()],
             "from": sender,
-            "value": params["value"] if "value" in params else 0,
-            "data": params["data"],
+            "value": params.get("value", 0),
+            "data": data,
         }
         if tx_type != 0:
             tx["type"] = tx_type
 
-        if "to" in params:
-            tx["to"] = params["to"]
+        to = params.get("to")
+        if to is not None:
+            tx["to"] = to
 
         if tx_type == 0:
-            tx["gasPrice"] = (
-                params["gasPrice"] if "gasPrice" in params else self._gas_price
-            )
+            tx["gasPrice"] = params.get("gasPrice", self._gas_price)
         elif tx_type == 1:
-            if "accessList" not in params:
+            if access_list is None:
                 tx["accessList"] = []
-            elif params["accessList"] != "auto":
-                tx["accessList"] = params["accessList"]
+            elif access_list != "auto":
+                tx["accessList"] = access_list
             tx["chainId"] = self._chain_id
-            tx["gasPrice"] = (
-                params["gasPrice"] if "gasPrice" in params else self._gas_price
-            )
+            tx["gasPrice"] = params.get("gasPrice", self._gas_price)
         elif tx_type == 2:
-            if "accessList" not in params:
+            if access_list is None:
                 tx["accessList"] = []
-            elif params["accessList"] != "auto":
-                tx["accessList"] = params["accessList"]
+            elif access_list != "auto":
+                tx["accessList"] = access_list
             tx["chainId"] = self._chain_id
-            tx["maxPriorityFeePerGas"] = (
-                params["maxPriorityFeePerGas"]
-                if "maxPriorityFeePerGas" in params
-                else self._max_priority_fee_per_gas
+            tx["maxPriorityFeePerGas"] = params.get(
+                "maxPriorityFeePerGas", self._max_priority_fee_per_gas
             )
             if "maxFeePerGas" in params:
                 tx["maxFeePerGas"] = params["maxFeePerGas"]
@@ -261,30 +237,26 @@ class Chain(wake.development.core.Chain):
                         tx["maxPriorityFeePerGas"] + self._initial_base_fee_per_gas
                     )
 
-        if "gas" not in params:
+        if gas is None:
             # use "max" when unset
             tx["gas"] = self._block_gas_limit
-        elif isinstance(params["gas"], int):
-            tx["gas"] = params["gas"]
-        elif params["gas"] == "auto":
+        elif isinstance(gas, int):
+            tx["gas"] = gas
+        elif gas == "auto":
             # auto
             try:
                 tx["gas"] = int(self._chain_interface.estimate_gas(tx) * 1.1)
             except JsonRpcError as e:
                 raise self._process_call_revert(e) from None
         else:
-            raise ValueError(f"Invalid gas value: {params['gas']}")
+            raise ValueError(f"Invalid gas value: {gas}")
 
-        if (
-            tx_type in {1, 2}
-            and "accessList" in params
-            and params["accessList"] == "auto"
-        ):
+        if tx_type in {1, 2} and access_list == "auto":
             try:
                 response = self._chain_interface.create_access_list(tx)
                 tx["accessList"] = response["accessList"]
 
-                if "gas" in params and params["gas"] == "auto":
+                if gas == "auto":
                     tx["gas"] = int(response["gasUsed"], 16)
             except JsonRpcError as e:
                 raise self._process_call_revert(e) from None
@@ -299,14 +271,22 @@ class Chain(wake.development.core.Chain):
         elif confirmations is None:
             confirmations = self.default_tx_confirmations
 
+        # every check is a JSON-RPC request, back off instead of hammering the node
+        # the first check is done immediately (automined txs are confirmed right away)
+        sleep_interval = _WAIT_INITIAL_SLEEP_INTERVAL
         while tx.status == TransactionStatusEnum.PENDING:
-            pass
+            time.sleep(sleep_interval)
+            sleep_interval = min(sleep_interval * 2, _WAIT_MAX_SLEEP_INTERVAL)
 
         if confirmations == 1:
             return
 
-        while self.blocks["latest"].number - tx.block_number < confirmations - 1:
-            pass
+        # only the head number is needed, not the whole latest block
+        target_block_number = tx.block_number + confirmations - 1
+        sleep_interval = _WAIT_INITIAL_SLEEP_INTERVAL
+        while self._chain_interface.get_block_number() < target_block_number:
+            time.sleep(sleep_interval)
+            sleep_interval = min(sleep_interval * 2, _WAIT_MAX_SLEEP_INTERVAL)
 
     def _confirm_transaction(self, tx: TxParams) -> None:
         pass